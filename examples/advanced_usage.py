@@ -14,8 +14,12 @@ from openhands_dynamic_agents import (
 )
 from openhands_dynamic_agents.core.prompt_processor import PromptProcessor
 
-async def analyze_with_prompt():
-    """Example using natural language prompts."""
+async def analyze_with_prompt(max_concurrency: int = 4):
+    """Example using natural language prompts.
+    
+    Prompts are analyzed concurrently; max_concurrency caps how many
+    requests are in flight so the LLM backend isn't overrun.
+    """
     # Initialize components
     processor = PromptProcessor()
     agent = DynamicAgent("smart_agent")
@@ -68,12 +72,27 @@ async def analyze_with_prompt():
         """
     ]
     
-    # Process each prompt
-    for prompt in prompts:
+    # Analyze intents up front (cheap and synchronous)
+    intents = processor.process_batch(prompts)
+    
+    # Execute analyses concurrently
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run(prompt: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await agent.process_prompt(prompt)
+    
+    results = await asyncio.gather(*(
+        run(prompt)
+        for prompt, intent_result in zip(prompts, intents)
+        if intent_result.success
+    ))
+    results_iter = iter(results)
+    
+    # Report each prompt in order
+    for prompt, intent_result in zip(prompts, intents):
         print("\nProcessing prompt:", prompt[:100], "...\n")
         
-        # Analyze intent
-        intent_result = processor.process(prompt)
         if not intent_result.success:
             print("Failed to process prompt:", intent_result.error)
             continue
@@ -85,8 +104,7 @@ async def analyze_with_prompt():
         print(f"- Focus Areas: {intent.focus_areas}")
         print(f"- Constraints: {intent.constraints}")
         
-        # Execute analysis
-        result = await agent.process_prompt(prompt)
+        result = next(results_iter)
         if result["status"] == "success":
             print("\nAnalysis Results:")
             pprint(result["analysis"])
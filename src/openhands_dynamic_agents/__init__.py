@@ -2,12 +2,16 @@
 OpenHands Dynamic Agents - A modular extension for dynamic agent generation.
 """
 
-from .core.dynamic_agent import DynamicAgent
-from .core.llm_factory import LLMAgentFactory
-from .core.keyword_manager import KeywordManager
-from .utils.result import OperationResult
-from .analysis.tech_stack import TechStackAnalyzer
-from .dashboard.app import Dashboard
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.dynamic_agent import DynamicAgent
+    from .core.llm_factory import LLMAgentFactory
+    from .core.keyword_manager import KeywordManager
+    from .utils.result import OperationResult
+    from .analysis.tech_stack import TechStackAnalyzer
+    from .dashboard.app import Dashboard
 
 __version__ = "0.1.0"
 __all__ = [
@@ -17,4 +21,27 @@ __all__ = [
     "OperationResult",
     "TechStackAnalyzer",
     "Dashboard"
-]
\ No newline at end of file
+]
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package does not pull in OpenHands, FastAPI, etc. until they are needed.
+_LAZY_IMPORTS = {
+    "DynamicAgent": ".core.dynamic_agent",
+    "LLMAgentFactory": ".core.llm_factory",
+    "KeywordManager": ".core.keyword_manager",
+    "OperationResult": ".utils.result",
+    "TechStackAnalyzer": ".analysis.tech_stack",
+    "Dashboard": ".dashboard.app"
+}
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first attribute access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
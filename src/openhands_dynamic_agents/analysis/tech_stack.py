@@ -2,13 +2,25 @@
 Technology stack analysis and framework detection.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Type
+import copy
+import functools
+import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
 import logging
 
 from ..utils.result import OperationResult
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 class TechStackAnalyzer:
@@ -43,6 +55,84 @@ class TechStackAnalyzer:
             }
         }
     }
+    
+    # Vendored, generated and tooling directories never worth scanning
+    SKIP_DIRS = frozenset({
+        ".git", "node_modules", "__pycache__", "dist", "build",
+        ".venv", "venv", ".tox"
+    })
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_bytes_per_file: Optional[int] = 65536,
+        cache_size: int = 32,
+        processes: Optional[int] = None,
+        min_files_per_process: int = 256
+    ):
+        """
+        Initialize the analyzer with precompiled file patterns.
+        
+        Args:
+            max_workers: Number of threads used to read candidate files
+            max_bytes_per_file: Bytes read from the head of each file when
+                scanning for frameworks (None reads whole files)
+            cache_size: Number of directory analyses kept in the LRU cache
+            processes: Worker processes used to shard framework scanning on
+                large repositories (None or 1 scans in this process)
+            min_files_per_process: Minimum files per worker before sharding
+                pays off over the process startup cost
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.max_bytes_per_file = max_bytes_per_file
+        self.processes = processes
+        self.min_files_per_process = min_files_per_process
+        
+        # Master pattern with a named group per technology so a single
+        # search classifies a file; groups are named t0, t1, ... since
+        # technology names need not be valid group names (e.g. "c++")
+        self._file_techs = {
+            f"t{i}": tech for i, tech in enumerate(self.TECH_PATTERNS)
+        }
+        self._master_file_re = re.compile(
+            "|".join(
+                f"(?P<t{i}>{'|'.join(patterns['files'])})"
+                for i, patterns in enumerate(self.TECH_PATTERNS.values())
+            ),
+            re.IGNORECASE
+        )
+        
+        # One bytes alternation per framework so the fallback scan makes a
+        # single pass per framework over the raw file bytes; empty patterns
+        # are dropped since they would match at every offset
+        self._fw_re = {
+            tech: {
+                fw: re.compile(b"|".join(re.escape(p.encode()) for p in fw_patterns if p))
+                for fw, fw_patterns in patterns["frameworks"].items()
+                if any(fw_patterns)
+            }
+            for tech, patterns in self.TECH_PATTERNS.items()
+        }
+        
+        # One Aho-Corasick automaton per technology finds every framework
+        # pattern in a single pass over the file content
+        self._fw_automata = {}
+        if ahocorasick is not None:
+            for tech, patterns in self.TECH_PATTERNS.items():
+                owners: Dict[str, List[str]] = {}
+                for fw, fw_patterns in patterns["frameworks"].items():
+                    for pattern in fw_patterns:
+                        owners.setdefault(pattern, []).append(fw)
+                automaton = ahocorasick.Automaton()
+                for pattern, fws in owners.items():
+                    automaton.add_word(pattern, (pattern, tuple(fws)))
+                automaton.make_automaton()
+                self._fw_automata[tech] = automaton
+        
+        # Results are cached per (path, candidate files, fingerprint)
+        self._analyze_cached = functools.lru_cache(maxsize=cache_size)(
+            self._analyze
+        )
 
     def analyze_directory(
         self,
@@ -54,114 +144,248 @@ class TechStackAnalyzer:
         
         Args:
             path: Directory path to analyze
-            max_files: Maximum number of files to analyze
+            max_files: Maximum number of technology files to analyze
             
         Returns:
             OperationResult containing:
                 - technologies: Dict of detected technologies and confidence scores
                 - frameworks: Dict of detected frameworks per technology
                 - recommendations: List of technology-specific recommendations
+        
+        Results are cached until the directory's fingerprint changes; see
+        _fingerprint for what it covers and clear_cache to force a rescan.
         """
+        path_str = os.fspath(path)
         try:
             # Collect files
-            files = list(path.rglob("*"))[:max_files]
+            files = tuple(islice(self._walk(path_str), max_files))
             
-            # Detect technologies
-            tech_scores = self._detect_technologies(files)
+            try:
+                fingerprint = self._fingerprint(files)
+            except OSError:
+                # A file vanished since the walk; analyze without caching
+                return self._analyze(path_str, files, None)
+            cached = self._analyze_cached(path_str, files, fingerprint)
+            # Callers get their own copy so edits never reach the cache
+            return OperationResult.success(copy.deepcopy(cached.data))
             
-            # Analyze frameworks for each detected technology
-            frameworks = {}
+        except Exception as e:
+            # Raised through the cache, so failures are never memoized
+            return self._analysis_error(path_str, e)
+
+    def clear_cache(self) -> None:
+        """Drop all cached directory analyses."""
+        self._analyze_cached.cache_clear()
+
+    @staticmethod
+    def _fingerprint(files: Tuple[Tuple[str, str], ...]) -> int:
+        """
+        Change marker for the analyzed files.
+        
+        Hashes the mtime and size of every candidate file, which is all the
+        analysis reads, so editing any of them (at any depth) invalidates
+        the cache; adding or removing files changes the file list, which
+        is part of the cache key too.
+        """
+        stat = os.stat
+        return hash(tuple(
+            (st.st_mtime_ns, st.st_size)
+            for st in (stat(file_str) for file_str, _ in files)
+        ))
+
+    def _analyze(
+        self,
+        path: str,
+        files: Tuple[Tuple[str, str], ...],
+        fingerprint: Optional[int]
+    ) -> OperationResult[Dict[str, Any]]:
+        """
+        Run the analysis; fingerprint only serves as part of the cache key.
+        
+        Exceptions propagate so that only successful results are cached.
+        """
+        # Detect technologies
+        tech_scores, files_by_tech = self._detect_technologies(files)
+        
+        # Analyze frameworks for each detected technology
+        frameworks = {}
+        with self._process_pool(len(files)) as pool:
             for tech, score in tech_scores.items():
                 if score > 0.1:  # Only analyze significant technologies
                     frameworks[tech] = self._detect_frameworks(
                         tech,
-                        files
+                        files_by_tech[tech],
+                        pool
                     )
-            
-            # Generate recommendations
-            recommendations = self._generate_recommendations(
-                tech_scores,
-                frameworks
-            )
-            
-            return OperationResult.success({
-                "technologies": tech_scores,
-                "frameworks": frameworks,
-                "recommendations": recommendations,
-                "files_analyzed": len(files)
-            })
-            
-        except Exception as e:
-            logger.error(f"Analysis failed: {e}")
-            return OperationResult.error(
-                str(e),
-                error_type="AnalysisError",
-                details={"path": str(path)}
-            )
+        
+        # Generate recommendations
+        recommendations = self._generate_recommendations(
+            tech_scores,
+            frameworks
+        )
+        
+        return OperationResult.success({
+            "technologies": tech_scores,
+            "frameworks": frameworks,
+            "recommendations": recommendations,
+            "files_analyzed": len(files)
+        })
+
+    @staticmethod
+    def _analysis_error(path: str, error: Exception) -> OperationResult[Dict[str, Any]]:
+        """Log and wrap an analysis failure."""
+        logger.error(f"Analysis failed: {error}")
+        return OperationResult.error(
+            str(error),
+            error_type="AnalysisError",
+            details={"path": path}
+        )
+
+    def _process_pool(self, num_files: int):
+        """Return a process pool context if sharding is worthwhile, else a no-op."""
+        if (
+            not self.processes
+            or self.processes < 2
+            or num_files < 2 * self.min_files_per_process
+        ):
+            return nullcontext()
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            initializer=_init_worker,
+            initargs=(type(self), self.max_workers, self.max_bytes_per_file)
+        )
+
+    def _walk(self, root: str) -> Iterator[Tuple[str, str]]:
+        """
+        Recursively yield candidate files under root with their technology.
+        
+        Symlinked directories are not followed, SKIP_DIRS are pruned, and
+        only files matching some technology's file patterns are yielded,
+        as (path, technology) pairs so no file is classified twice.
+        """
+        match_file = self._master_file_re.search
+        file_techs = self._file_techs
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.SKIP_DIRS:
+                            yield from self._walk(entry.path)
+                    elif entry.is_file():
+                        match = match_file(entry.name)
+                        if match:
+                            yield entry.path, file_techs[match.lastgroup]
+        except OSError as e:
+            logger.warning(f"Could not scan {root}: {e}")
+
+    def _read_file(self, path: str) -> Optional[bytes]:
+        """
+        Read the head of a file as raw bytes.
+        
+        Imports and top-level identifiers sit near the top of a file, so
+        reading is capped at max_bytes_per_file.
+        
+        Returns:
+            File bytes, or None if the file could not be read
+        """
+        try:
+            with open(path, "rb") as f:
+                return f.read(self.max_bytes_per_file)
+        except OSError as e:
+            logger.warning(f"Could not read {path}: {e}")
+            return None
 
     def _detect_technologies(
         self,
-        files: List[Path]
-    ) -> Dict[str, float]:
+        files: Iterable[Tuple[str, str]]
+    ) -> Tuple[Dict[str, float], Dict[str, List[str]]]:
         """
         Detect technologies and their confidence scores.
         
+        Args:
+            files: (path, technology) pairs as yielded by _walk
+            
         Returns:
-            Dict mapping technology to confidence score (0-1)
+            Tuple of:
+                - Dict mapping technology to confidence score (0-1)
+                - Dict mapping technology to the files classified as it
         """
-        scores = {}
+        scores = Counter()
+        files_by_tech = {tech: [] for tech in self.TECH_PATTERNS}
         total_matches = 0
         
-        # Count file pattern matches
-        for file in files:
-            file_str = str(file)
-            for tech, patterns in self.TECH_PATTERNS.items():
-                for pattern in patterns["files"]:
-                    if re.search(pattern, file_str, re.IGNORECASE):
-                        scores[tech] = scores.get(tech, 0) + 1
-                        total_matches += 1
+        # Count files per technology; _walk already classified them
+        for file_str, tech in files:
+            scores[tech] += 1
+            files_by_tech[tech].append(file_str)
+            total_matches += 1
         
-        # Normalize scores
-        if total_matches > 0:
-            return {k: v/total_matches for k, v in scores.items()}
-        return {}
+        return self._normalize(scores, total_matches), files_by_tech
 
     def _detect_frameworks(
         self,
         tech: str,
-        files: List[Path]
+        files: List[str],
+        pool: Optional[ProcessPoolExecutor] = None
     ) -> Dict[str, float]:
         """
         Detect frameworks for a specific technology.
         
+        Args:
+            tech: Technology whose frameworks to detect
+            files: Files already classified as belonging to tech
+            pool: Optional process pool to shard the scan across
+            
         Returns:
             Dict mapping framework to confidence score (0-1)
         """
         if tech not in self.TECH_PATTERNS:
             return {}
             
-        framework_scores = {}
-        total_matches = 0
+        if pool is None or len(files) < 2 * self.min_files_per_process:
+            framework_scores = self._count_frameworks(tech, files)
+        else:
+            # Contiguous chunks keep files from the same directory together
+            size = -(-len(files) // self.processes)
+            chunks = [files[i:i + size] for i in range(0, len(files), size)]
+            framework_scores = Counter()
+            for partial in pool.map(_scan_chunk, [tech] * len(chunks), chunks):
+                framework_scores.update(partial)
         
-        # Check each file for framework patterns
-        for file in files:
-            if not any(re.search(p, str(file)) for p in self.TECH_PATTERNS[tech]["files"]):
-                continue
-                
-            try:
-                content = file.read_text()
-                for fw, patterns in self.TECH_PATTERNS[tech]["frameworks"].items():
-                    for pattern in patterns:
-                        if pattern in content:
-                            framework_scores[fw] = framework_scores.get(fw, 0) + 1
-                            total_matches += 1
-            except Exception as e:
-                logger.warning(f"Could not read {file}: {e}")
-        
-        # Normalize scores
-        if total_matches > 0:
-            return {k: v/total_matches for k, v in framework_scores.items()}
-        return {}
+        return self._normalize(framework_scores, sum(framework_scores.values()))
+
+    def _count_frameworks(self, tech: str, files: List[str]) -> Counter:
+        """Count framework pattern hits for a technology across files."""
+        framework_scores = Counter()
+        automaton = self._fw_automata.get(tech)
+        
+        # Read files concurrently; matching stays on this thread so the
+        # score dicts need no locking
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for content in executor.map(self._read_file, files):
+                if content is None:
+                    continue
+                # Scores reflect how often each pattern occurs, not just
+                # whether it occurs at least once
+                if automaton is not None:
+                    text = content.decode("utf-8", errors="replace")
+                    for _, (_, fws) in automaton.iter(text):
+                        for fw in fws:
+                            framework_scores[fw] += 1
+                    continue
+                for fw, regex in self._fw_re[tech].items():
+                    hits = len(regex.findall(content))
+                    if hits:
+                        framework_scores[fw] += hits
+        
+        return framework_scores
+
+    @staticmethod
+    def _normalize(counts: Counter, total: int) -> Dict[str, float]:
+        """Convert raw hit counts into confidence scores (0-1) summing to 1."""
+        if total <= 0:
+            return {}
+        return {k: v / total for k, v in counts.items()}
 
     def _generate_recommendations(
         self,
@@ -181,7 +405,7 @@ class TechStackAnalyzer:
         # Framework-specific recommendations
         for tech, fw_scores in frameworks.items():
             if tech == "python":
-                if "django" in fw_scores and fw_scores["django"] > 0.7:
+                if fw_scores.get("django", 0.0) > 0.7:
                     recommendations.append({
                         "type": "framework",
                         "message": "High Django usage detected. Consider using Django REST framework for APIs"
@@ -194,4 +418,28 @@ class TechStackAnalyzer:
                         "message": "React detected without TypeScript. Consider adding TypeScript for better maintainability"
                     })
         
-        return recommendations
\ No newline at end of file
+        return recommendations
+
+# Per-process analyzer used by sharded framework scans
+_worker_analyzer: Optional[TechStackAnalyzer] = None
+
+def _init_worker(
+    analyzer_cls: Type[TechStackAnalyzer],
+    max_workers: int,
+    max_bytes_per_file: Optional[int]
+) -> None:
+    """
+    Build the worker's analyzer (patterns and automata) once per process.
+    
+    Uses the caller's analyzer class so subclass TECH_PATTERNS carry over.
+    """
+    global _worker_analyzer
+    _worker_analyzer = analyzer_cls(
+        max_workers=max_workers,
+        max_bytes_per_file=max_bytes_per_file,
+        cache_size=0
+    )
+
+def _scan_chunk(tech: str, files: List[str]) -> Counter:
+    """Count framework hits for one shard of files in a worker process."""
+    return _worker_analyzer._count_frameworks(tech, files)
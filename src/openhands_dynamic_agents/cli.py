@@ -10,8 +10,11 @@ from typing import Optional
 import logging
 
 from .analysis.tech_stack import TechStackAnalyzer
-from .dashboard.app import Dashboard
-from .core.dynamic_agent import DynamicAgent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -127,34 +130,43 @@ def analyze_repo(path: str, output: Optional[str], format: str):
             click.echo(f"Analysis failed: {result.error}", err=True)
             sys.exit(1)
             
-        # Format output
+        # Format output (JSON may be produced as bytes by orjson)
         if format == "json":
-            output_text = json.dumps(result.data, indent=2)
+            if orjson is not None:
+                output_text = orjson.dumps(result.data, option=orjson.OPT_INDENT_2)
+            else:
+                output_text = json.dumps(result.data, indent=2)
         elif format == "yaml":
             import yaml
-            output_text = yaml.dump(result.data)
+            try:
+                from yaml import CSafeDumper as Dumper  # libyaml-backed
+            except ImportError:
+                from yaml import SafeDumper as Dumper
+            output_text = yaml.dump(result.data, Dumper=Dumper)
         else:
             # Text format
-            output_text = "\nTechnology Stack Analysis\n"
-            output_text += "=" * 50 + "\n\n"
+            parts = ["\nTechnology Stack Analysis\n", "=" * 50 + "\n\n"]
             
-            output_text += "Technologies:\n"
+            parts.append("Technologies:\n")
             for tech, score in result.data["technologies"].items():
-                output_text += f"  - {tech}: {score:.2%}\n"
+                parts.append(f"  - {tech}: {score:.2%}\n")
             
-            output_text += "\nFrameworks:\n"
+            parts.append("\nFrameworks:\n")
             for tech, frameworks in result.data["frameworks"].items():
-                output_text += f"  {tech}:\n"
+                parts.append(f"  {tech}:\n")
                 for fw, score in frameworks.items():
-                    output_text += f"    - {fw}: {score:.2%}\n"
+                    parts.append(f"    - {fw}: {score:.2%}\n")
             
-            output_text += "\nRecommendations:\n"
+            parts.append("\nRecommendations:\n")
             for rec in result.data["recommendations"]:
-                output_text += f"  - {rec['message']}\n"
+                parts.append(f"  - {rec['message']}\n")
+            
+            output_text = "".join(parts)
         
         # Output results
         if output:
-            with open(output, "w") as f:
+            mode = "wb" if isinstance(output_text, bytes) else "w"
+            with open(output, mode) as f:
                 f.write(output_text)
             click.echo(f"Results saved to {output}")
         else:
@@ -173,6 +185,8 @@ def analyze_repo(path: str, output: Optional[str], format: str):
 )
 def analyze_code(file: str, tech: Optional[str]):
     """Analyze a code file using a dynamic agent."""
+    from .core.dynamic_agent import DynamicAgent
+    
     try:
         # Read code file
         with open(file) as f:
@@ -261,6 +275,8 @@ def dashboard(host: str, port: int):
     # Start in development mode
     $ agents dashboard --dev
     """
+    from .dashboard.app import Dashboard
+    
     try:
         click.echo(f"Starting dashboard at http://{host}:{port}")
         dashboard = Dashboard(host=host, port=port)
@@ -318,6 +334,8 @@ def create(name: str, keyword: str, options: Optional[str]):
     # Create with inline options
     $ agents create web_agent javascript '{"frameworks": ["react"]}'
     """
+    from .core.dynamic_agent import DynamicAgent
+    
     try:
         # Load options if provided
         agent_options = {}
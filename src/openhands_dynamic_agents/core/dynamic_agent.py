@@ -2,8 +2,10 @@
 Core implementation of the dynamic agent system that integrates with OpenHands.
 """
 
-from typing import Dict, Any, Optional, Type
+from typing import Dict, Any, List, Optional, Type
 from pathlib import Path
+import asyncio
+import copy
 import logging
 from datetime import datetime
 
@@ -16,6 +18,8 @@ from ..utils.monitoring import monitor_performance
 from ..utils.validation import validate_input
 from .llm_factory import LLMAgentFactory
 from .keyword_manager import KeywordManager
+from .prompt_processor import PromptProcessor
+from .inference_worker import InferenceWorker
 
 logger = logging.getLogger(__name__)
 
@@ -57,8 +61,13 @@ class DynamicAgent(BaseMicroAgent):
         # Initialize components
         self.llm_factory = LLMAgentFactory()
         self.keyword_manager = KeywordManager()
+        self.prompt_processor = PromptProcessor()
+        self.inference_worker = InferenceWorker(
+            self._process_prompt_batch,
+            size_fn=len  # Character count stands in for prompt tokens
+        )
 
-    @monitor_performance
+    @monitor_performance()
     def generate(self) -> OperationResult[Type[BaseMicroAgent]]:
         """
         Generate the agent implementation using LLM.
@@ -152,4 +161,83 @@ class DynamicAgent(BaseMicroAgent):
                     "options": self.options,
                     "input_data": data
                 }
-            }
\ No newline at end of file
+            }
+
+    async def process_prompt(self, prompt: str) -> Dict[str, Any]:
+        """
+        Process a natural language prompt and run the analysis it describes.
+        
+        Concurrent calls are coalesced by the agent's InferenceWorker, so a
+        batch of prompts shares a single generation step.
+        
+        Returns:
+            Dict with "status" and either "intent"/"analysis" or "error"
+        """
+        return await self.inference_worker.run(prompt)
+
+    async def _process_prompt_batch(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """Generate the agent once and run it for every prompt in the batch."""
+        try:
+            generation_result = await asyncio.to_thread(self.generate)
+            if not generation_result.success:
+                error = {
+                    "status": "error",
+                    "error": str(generation_result.error),
+                    "details": generation_result.error.to_dict()
+                }
+                # Each caller gets its own copy to mutate
+                return [copy.deepcopy(error) for _ in prompts]
+                
+            agent_instance = generation_result.data()
+        except Exception as e:
+            logger.error(f"Agent execution failed: {e}")
+            return [
+                {
+                    "status": "error",
+                    "error": f"Execution failed: {str(e)}",
+                    "details": {
+                        "keyword": self.keyword,
+                        "prompt": prompt
+                    }
+                }
+                for prompt in prompts
+            ]
+            
+        intent_results = self.prompt_processor.process_batch(prompts)
+        results = []
+        for prompt, intent_result in zip(prompts, intent_results):
+            if not intent_result.success:
+                results.append({
+                    "status": "error",
+                    "error": str(intent_result.error),
+                    "details": intent_result.error.to_dict()
+                })
+                continue
+                
+            intent = intent_result.data
+            snippets = intent.context.get("code_snippets", [])
+            try:
+                # Off the event loop so one batch does not stall the rest
+                analysis = await asyncio.to_thread(agent_instance.run, {
+                    "code_snippet": "\n\n".join(s["code"] for s in snippets) or prompt,
+                    "analysis_type": intent.action,
+                    "focus_areas": intent.focus_areas
+                })
+                results.append({
+                    "status": "success",
+                    "intent": intent,
+                    "analysis": analysis,
+                    "metadata": generation_result.metadata
+                })
+            except Exception as e:
+                logger.error(f"Agent execution failed: {e}")
+                results.append({
+                    "status": "error",
+                    "error": f"Execution failed: {str(e)}",
+                    "details": {
+                        "keyword": self.keyword,
+                        "prompt": prompt
+                    }
+                })
+                
+        return results
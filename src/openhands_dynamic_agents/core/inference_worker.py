@@ -0,0 +1,187 @@
+"""
+Request coalescing for LLM-backed agent calls.
+"""
+
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+BatchHandler = Callable[[List[T]], Awaitable[List[R]]]
+
+class InferenceWorker(Generic[T, R]):
+    """
+    Coalesces concurrent requests into batched backend calls.
+
+    Callers await `run(item)` as if it were a single request. A background
+    task collects pending items until `max_batch_size` is reached or
+    `max_wait_ms` has passed since the first one arrived, hands the whole
+    batch to the handler, and resolves each caller's future with its result.
+    Flushed batches run concurrently, so a slow batch does not hold up the
+    next one.
+
+    If `size_fn` is given, items are first grouped into power-of-two size
+    buckets so that each batch holds items of similar length, which keeps
+    padding waste low on the backend.
+    """
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        size_fn: Optional[Callable[[T], int]] = None
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            handler: Coroutine function mapping a list of items to a list of
+                results of the same length and order
+            max_batch_size: Maximum number of items per handler call
+            max_wait_ms: Maximum time to wait for a batch to fill up
+            size_fn: Optional function returning an item's length (e.g. a
+                token count) used to bucket items of similar size
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.size_fn = size_fn
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    async def run(self, item: T) -> R:
+        """
+        Submit an item and wait for its result.
+
+        Raises:
+            Exception: Whatever size_fn raised for the item, or whatever the
+                handler raised for the item's batch
+        """
+        # Bucket here so a failing size_fn is reported to its own caller
+        # instead of reaching the background task
+        key = self._bucket_key(item)
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((key, item, future))
+        return await future
+
+    async def close(self) -> None:
+        """
+        Stop the background task and any in-flight batches.
+        
+        Callers still waiting on `run()` (queued, bucketed or in an
+        in-flight batch) are cancelled rather than left hanging.
+        """
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+                
+        batches = list(self._batches)
+        for batch_task in batches:
+            batch_task.cancel()
+        await asyncio.gather(*batches, return_exceptions=True)
+                
+        # Items the task never picked up
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                future.cancel()
+        self._task = None
+        self._queue = None
+
+    def _ensure_started(self) -> None:
+        """Start the background task on the running loop if needed."""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._serve())
+
+    def _bucket_key(self, item: T) -> int:
+        """Return the power-of-two size bucket for an item."""
+        if self.size_fn is None:
+            return 0
+        return 1 << self.size_fn(item).bit_length()
+
+    async def _serve(self) -> None:
+        """Collect pending items into size buckets and dispatch them."""
+        loop = asyncio.get_running_loop()
+        wait = self.max_wait_ms / 1000
+        # bucket key -> (arrival time of first item, pending items)
+        buckets: Dict[int, Tuple[float, List[Tuple[T, asyncio.Future]]]] = {}
+
+        try:
+            while True:
+                timeout = None
+                if buckets:
+                    oldest_key = min(buckets, key=lambda k: buckets[k][0])
+                    timeout = buckets[oldest_key][0] + wait - loop.time()
+
+                if timeout is not None and timeout <= 0:
+                    # The oldest bucket has waited long enough
+                    self._start_batch(buckets.pop(oldest_key)[1])
+                    continue
+
+                try:
+                    key, item, future = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    continue
+
+                _, bucket = buckets.setdefault(key, (loop.time(), []))
+                bucket.append((item, future))
+                if len(bucket) >= self.max_batch_size:
+                    del buckets[key]
+                    self._start_batch(bucket)
+        finally:
+            # Shutting down: nothing left in a bucket will be dispatched
+            for _, bucket in buckets.values():
+                for _, future in bucket:
+                    future.cancel()
+
+    def _start_batch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Dispatch a batch in its own task so the serve loop keeps going."""
+        def finished(task: asyncio.Task) -> None:
+            self._batches.discard(task)
+            # A task cancelled before it starts never enters _dispatch
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._batches.add(task)
+        task.add_done_callback(finished)
+
+    async def _dispatch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Run the handler on a batch and fulfil each caller's future."""
+        pending = [(item, future) for item, future in batch if not future.cancelled()]
+        if not pending:
+            return
+
+        try:
+            results = await self.handler([item for item, _ in pending])
+            if len(results) != len(pending):
+                raise ValueError(
+                    f"Batch handler returned {len(results)} results for {len(pending)} items"
+                )
+        except asyncio.CancelledError:
+            # The worker is closing mid-batch
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Batch of {len(pending)} failed: {e}")
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
@@ -25,7 +25,7 @@ class LLMAgentFactory:
         self.model = model
         self.templates = AGENT_TEMPLATES
 
-    @monitor_performance
+    @monitor_performance()
     def create_agent(
         self,
         keyword: str,
@@ -2,18 +2,49 @@
 Enhanced prompt processing for dynamic agents.
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 from dataclasses import dataclass
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+import copy
 import re
+import threading
 from pathlib import Path
 import logging
 import json
 
 from ..utils.result import OperationResult
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
+# google-re2 runs the keyword patterns as a linear-time DFA on ASCII prompts;
+# patterns it rejects (lookarounds, backreferences) stay on the stdlib engine
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional speedup
+    re2 = None
+    _RE2_OPTIONS = None
+else:
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Characters that make a keyword pattern more than literal text
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+# Focus areas that also call for a given extension
+_RELATIONS: Dict[str, FrozenSet[str]] = {
+    "security": frozenset({"vulnerability", "auth", "encryption"}),
+    "performance": frozenset({"optimization", "speed", "efficiency"}),
+    "quality": frozenset({"lint", "style", "complexity"})
+}
+
+@dataclass(slots=True, frozen=True)
 class PromptIntent:
     """Structured representation of prompt intent."""
     
@@ -30,20 +61,17 @@ class PromptIntent:
 
     def requires_extension(self, extension_name: str) -> bool:
         """Check if this intent requires a specific extension."""
+        # Built per call: focus_areas is a plain list callers may mutate
+        focus_set = frozenset(self.focus_areas)
         return (
-            extension_name in self.focus_areas or
-            any(ext in self.focus_areas for ext in self.get_related_extensions(extension_name))
+            extension_name in focus_set or
+            bool(focus_set & _RELATIONS.get(extension_name, frozenset()))
         )
 
     @staticmethod
-    def get_related_extensions(extension_name: str) -> Set[str]:
+    def get_related_extensions(extension_name: str) -> FrozenSet[str]:
         """Get related extensions for a given extension."""
-        relations = {
-            "security": {"vulnerability", "auth", "encryption"},
-            "performance": {"optimization", "speed", "efficiency"},
-            "quality": {"lint", "style", "complexity"}
-        }
-        return relations.get(extension_name, set())
+        return _RELATIONS.get(extension_name, frozenset())
 
 class PromptProcessor:
     """
@@ -74,23 +102,145 @@ class PromptProcessor:
         "quality": r"quality|clean|maintainable|readable|style",
         "testing": r"test|coverage|unit test|integration",
     }
+    
+    # Weights of the action, technology and focus scores in overall confidence
+    CONFIDENCE_WEIGHTS = (0.4, 0.4, 0.2)
+    
+    # Numeric constraints and the integer they capture
+    _NUMBER_PATTERNS = {
+        key: re.compile(pattern, re.IGNORECASE)
+        for key, pattern in {
+            "max_complexity": r"max(?:imum)?\s+complexity\s+(?:of\s+)?(\d+)",
+            "min_coverage": r"min(?:imum)?\s+coverage\s+(?:of\s+)?(\d+)%?",
+            "timeout": r"timeout\s+(?:of\s+)?(\d+)\s*(?:s|seconds)?",
+        }.items()
+    }
+    
+    # Boolean constraints
+    _BOOL_PATTERNS = {
+        key: re.compile(pattern, re.IGNORECASE)
+        for key, pattern in {
+            "strict_mode": r"strict\s+mode",
+            "debug": r"debug\s+mode",
+            "verbose": r"verbose",
+        }.items()
+    }
+    
+    # Context extraction
+    _FILE_RE = re.compile(r"(?:file|path):\s*([^\s,]+)")
+    _CODE_RE = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+    _URL_RE = re.compile(r"https?://\S+")
 
-    def __init__(self):
-        """Initialize the prompt processor."""
-        # Compile regex patterns
-        self.tech_regex = {
-            tech: re.compile(pattern, re.IGNORECASE)
-            for tech, pattern in self.TECH_PATTERNS.items()
-        }
-        self.action_regex = {
-            action: re.compile(pattern, re.IGNORECASE)
-            for action, pattern in self.ACTION_PATTERNS.items()
+    def __init__(self, cache_size: int = 2048):
+        """
+        Initialize the prompt processor.
+        
+        Args:
+            cache_size: Number of prompts whose extraction results are cached
+        """
+        # Extraction is deterministic in the prompt, so repeated prompts skip
+        # all pattern matching. A plain LRU dict rather than lru_cache, so
+        # process_batch can look prompts up before scanning the misses.
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs):
+        """Recompile patterns for subclasses that override the pattern dicts."""
+        super().__init_subclass__(**kwargs)
+        cls._compile_patterns()
+
+    @classmethod
+    def _compile_patterns(cls) -> None:
+        """
+        Compile the keyword patterns once per class.
+        
+        The compiled patterns are class attributes shared by every instance,
+        so creating a processor (e.g. per request) compiles nothing.
+        """
+        # One compiled pattern per keyword set, searched independently so
+        # overlapping keywords (e.g. "check" for both analyze and test) are
+        # each credited
+        cls.tech_regex = cls._compile_category(cls.TECH_PATTERNS)
+        cls.action_regex = cls._compile_category(cls.ACTION_PATTERNS)
+        cls.focus_regex = cls._compile_category(cls.FOCUS_PATTERNS)
+        
+        # re2 folds case differently from re on non-ASCII text (e.g. "ı"),
+        # so its compiled patterns serve ASCII prompts only
+        cls._ascii_regex = tuple(
+            cls._compile_ascii_category(compiled)
+            for compiled in (cls.action_regex, cls.tech_regex, cls.focus_regex)
+        )
+        
+        # When every pattern is a plain alternation of literal keywords, one
+        # Aho-Corasick automaton finds them all in a single scan; subclasses
+        # using real regex syntax stay on the regex path
+        cls._keyword_automaton = (
+            cls._build_keyword_automaton()
+            if ahocorasick is not None and cls._patterns_are_literal()
+            else None
+        )
+
+    @classmethod
+    def _patterns_are_literal(cls) -> bool:
+        """Check whether every keyword in every pattern is literal ASCII text."""
+        return all(
+            keyword and keyword.isascii() and not _REGEX_META.intersection(keyword)
+            for patterns in (cls.ACTION_PATTERNS, cls.TECH_PATTERNS, cls.FOCUS_PATTERNS)
+            for pattern in patterns.values()
+            for keyword in pattern.split("|")
+        )
+
+    @classmethod
+    def _build_keyword_automaton(cls) -> "ahocorasick.Automaton":
+        """Build an automaton mapping each lowercased keyword to its owners."""
+        owners: Dict[str, List[Tuple[str, str]]] = {}
+        for category, patterns in (
+            ("action", cls.ACTION_PATTERNS),
+            ("technology", cls.TECH_PATTERNS),
+            ("focus", cls.FOCUS_PATTERNS),
+        ):
+            for name, pattern in patterns.items():
+                for keyword in pattern.split("|"):
+                    owners.setdefault(keyword.lower(), []).append((category, name))
+                    
+        automaton = ahocorasick.Automaton()
+        for keyword, keyword_owners in owners.items():
+            automaton.add_word(keyword, tuple(keyword_owners))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _compile_category(patterns: Dict[str, str]) -> Dict[str, re.Pattern]:
+        """Compile each of a category's patterns case-insensitively."""
+        return {
+            name: re.compile(pattern, re.IGNORECASE)
+            for name, pattern in patterns.items()
         }
-        self.focus_regex = {
-            focus: re.compile(pattern, re.IGNORECASE)
-            for focus, pattern in self.FOCUS_PATTERNS.items()
+
+    @classmethod
+    def _compile_ascii_category(
+        cls,
+        compiled: Dict[str, re.Pattern]
+    ) -> Dict[str, re.Pattern]:
+        """Swap in re2 for each pattern it supports, keeping re otherwise."""
+        return {
+            name: cls._compile_re2(regex.pattern) or regex
+            for name, regex in compiled.items()
         }
 
+    @staticmethod
+    def _compile_re2(pattern: str) -> Optional[re.Pattern]:
+        """Compile a case-insensitive pattern with re2, or None if it can't."""
+        if re2 is None or not pattern.isascii():
+            return None
+        try:
+            # Inline (?i) since re2 has no IGNORECASE flag constant
+            return re2.compile("(?i)" + pattern, _RE2_OPTIONS)
+        except re2.error:
+            # Lookarounds, backreferences and the like
+            return None
+
     def process(self, prompt: str) -> OperationResult[PromptIntent]:
         """
         Process a natural language prompt and extract structured intent.
@@ -102,101 +252,270 @@ class PromptProcessor:
             OperationResult containing PromptIntent or error
         """
         try:
-            # Extract components
-            action = self._extract_action(prompt)
-            technologies = self._extract_technologies(prompt)
-            focus_areas = self._extract_focus_areas(prompt)
-            constraints = self._extract_constraints(prompt)
-            context = self._extract_context(prompt)
-            
-            # Validate extracted information
-            if not action:
-                return OperationResult.error(
-                    "Could not determine action from prompt",
-                    error_type="IntentError",
-                    details={"prompt": prompt}
-                )
-                
-            if not technologies:
-                return OperationResult.error(
-                    "No technology keywords found in prompt",
-                    error_type="IntentError",
-                    details={"prompt": prompt}
-                )
+            return self._build_result(prompt, self._extract_cached(prompt))
+        except Exception as e:
+            return self._processing_error(prompt, e)
+
+    def process_batch(self, prompts: List[str]) -> List[OperationResult[PromptIntent]]:
+        """
+        Process several prompts in one call.
+        
+        Keywords for the whole batch are found in a single scan over the
+        joined prompts (see _scan_keywords_many); constraints and context
+        are still extracted per prompt. Prompts already in the result cache
+        are served from it, and only the rest are scanned.
+        
+        Args:
+            prompts: Natural language prompts from user
             
-            # Create intent
-            intent = PromptIntent(
-                action=action,
-                technologies=technologies,
-                focus_areas=focus_areas,
-                constraints=constraints,
-                context=context
-            )
+        Returns:
+            List of OperationResults, one per prompt, in input order
+        """
+        found = {}
+        for prompt in prompts:
+            if prompt not in found:
+                found[prompt] = self._cache_get(prompt)
+        misses = [prompt for prompt, components in found.items() if components is None]
+        
+        try:
+            keywords = self._scan_keywords_many(misses) if misses else []
+        except Exception as e:
+            return [self._processing_error(prompt, e) for prompt in prompts]
             
-            return OperationResult.success(
-                intent,
-                metadata={
-                    "original_prompt": prompt,
-                    "confidence_scores": self._calculate_confidence(prompt, intent)
-                }
+        failed = {}
+        for prompt, prompt_keywords in zip(misses, keywords):
+            try:
+                found[prompt] = self._components(prompt, prompt_keywords)
+                self._cache_put(prompt, found[prompt])
+            except Exception as e:
+                failed[prompt] = e
+                
+        results = []
+        for prompt in prompts:
+            if prompt in failed:
+                results.append(self._processing_error(prompt, failed[prompt]))
+                continue
+            try:
+                results.append(self._build_result(prompt, found[prompt]))
+            except Exception as e:
+                results.append(self._processing_error(prompt, e))
+        return results
+
+    def _extract_cached(self, prompt: str) -> Tuple[
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Dict[str, Any],
+        Dict[str, Any]
+    ]:
+        """Return a prompt's extracted components, from the cache if present."""
+        components = self._cache_get(prompt)
+        if components is None:
+            components = self._extract_components(prompt)
+            self._cache_put(prompt, components)
+        return components
+
+    def _cache_get(self, prompt: str) -> Optional[Tuple]:
+        """Look up cached components, marking them most recently used."""
+        with self._cache_lock:
+            components = self._cache.get(prompt)
+            if components is not None:
+                self._cache.move_to_end(prompt)
+            return components
+
+    def _cache_put(self, prompt: str, components: Tuple) -> None:
+        """Cache components, evicting the least recently used entry if full."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[prompt] = components
+            self._cache.move_to_end(prompt)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _build_result(
+        self,
+        prompt: str,
+        components: Tuple[
+            Tuple[str, ...],
+            Tuple[str, ...],
+            Tuple[str, ...],
+            Dict[str, Any],
+            Dict[str, Any]
+        ]
+    ) -> OperationResult[PromptIntent]:
+        """Validate extracted components and build the intent result."""
+        # Components may come from the cache, so they are copied and callers
+        # can mutate the intent's lists and dicts freely
+        actions, technologies, focus_areas, constraints, context = components
+        action = actions[0] if actions else None
+        
+        # Validate extracted information
+        if not action:
+            return OperationResult.error(
+                "Could not determine action from prompt",
+                error_type="IntentError",
+                details={"prompt": prompt}
             )
             
-        except Exception as e:
-            logger.error(f"Failed to process prompt: {e}")
+        if not technologies:
             return OperationResult.error(
-                str(e),
-                error_type="ProcessingError",
+                "No technology keywords found in prompt",
+                error_type="IntentError",
                 details={"prompt": prompt}
             )
+        
+        # Create intent
+        intent = PromptIntent(
+            action=action,
+            technologies=list(technologies),
+            focus_areas=list(focus_areas),
+            constraints=dict(constraints),
+            context=copy.deepcopy(context)
+        )
+        
+        return OperationResult.success(
+            intent,
+            metadata={
+                "original_prompt": prompt,
+                "confidence_scores": self._calculate_confidence(intent, len(actions))
+            }
+        )
 
-    def _extract_action(self, prompt: str) -> Optional[str]:
-        """Extract the primary action from the prompt."""
-        for action, pattern in self.action_regex.items():
-            if pattern.search(prompt):
-                return action
-        return None
+    @staticmethod
+    def _processing_error(prompt: str, error: Exception) -> OperationResult[PromptIntent]:
+        """Log and wrap an unexpected processing failure."""
+        logger.error(f"Failed to process prompt: {error}")
+        return OperationResult.error(
+            str(error),
+            error_type="ProcessingError",
+            details={"prompt": prompt}
+        )
 
-    def _extract_technologies(self, prompt: str) -> List[str]:
-        """Extract technology keywords from the prompt."""
-        technologies = []
-        for tech, pattern in self.tech_regex.items():
-            if pattern.search(prompt):
-                technologies.append(tech)
-        return technologies
+    def _extract_components(self, prompt: str) -> Tuple[
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Dict[str, Any],
+        Dict[str, Any]
+    ]:
+        """
+        Run every extractor over a prompt.
+        
+        Returns:
+            Tuple of (actions, technologies, focus_areas, constraints, context);
+            the result is cached, so callers must not mutate it
+        """
+        return self._components(prompt, self._scan_keywords(prompt))
 
-    def _extract_focus_areas(self, prompt: str) -> List[str]:
-        """Extract focus areas from the prompt."""
-        focus_areas = []
-        for focus, pattern in self.focus_regex.items():
-            if pattern.search(prompt):
-                focus_areas.append(focus)
-        return focus_areas
+    def _components(
+        self,
+        prompt: str,
+        keywords: Tuple[List[str], List[str], List[str]]
+    ) -> Tuple[
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Dict[str, Any],
+        Dict[str, Any]
+    ]:
+        """Combine scanned keywords with the prompt's constraints and context."""
+        actions, technologies, focus_areas = keywords
+        return (
+            tuple(actions),
+            tuple(technologies),
+            tuple(focus_areas),
+            self._extract_constraints(prompt),
+            self._extract_context(prompt)
+        )
+
+    def _scan_keywords(self, prompt: str) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Find the actions, technologies and focus areas mentioned in a prompt.
+        
+        Returns:
+            Tuple of (actions, technologies, focus_areas), each in the order
+            of its pattern dict
+        """
+        return self._scan_keywords_many([prompt])[0]
+
+    def _scan_keywords_many(
+        self,
+        prompts: List[str]
+    ) -> List[Tuple[List[str], List[str], List[str]]]:
+        """
+        Find keywords for many prompts.
+        
+        With the automaton, ASCII prompts are joined with a record
+        separator, which no keyword contains, and scanned once; each match
+        is attributed to its prompt by bisecting the match position into
+        the prompts' start offsets. Other prompts have each pattern
+        searched individually.
+        
+        Returns:
+            One (actions, technologies, focus_areas) tuple per prompt
+        """
+        if self._keyword_automaton is None:
+            return [self._search_keywords(prompt) for prompt in prompts]
+            
+        # Lowercasing only agrees with re.IGNORECASE on ASCII text (re also
+        # folds e.g. "ſ" to "s"), so only ASCII prompts use the automaton
+        scanned = iter(self._scan_ascii_keywords(
+            [prompt for prompt in prompts if prompt.isascii()]
+        ))
+        return [
+            next(scanned) if prompt.isascii() else self._search_keywords(prompt)
+            for prompt in prompts
+        ]
+
+    def _search_keywords(self, prompt: str) -> Tuple[List[str], List[str], List[str]]:
+        """Search each compiled keyword pattern in a prompt."""
+        if prompt.isascii():
+            action_regex, tech_regex, focus_regex = self._ascii_regex
+        else:
+            action_regex, tech_regex, focus_regex = (
+                self.action_regex, self.tech_regex, self.focus_regex
+            )
+        return (
+            [a for a, regex in action_regex.items() if regex.search(prompt)],
+            [t for t, regex in tech_regex.items() if regex.search(prompt)],
+            [f for f, regex in focus_regex.items() if regex.search(prompt)]
+        )
+
+    def _scan_ascii_keywords(
+        self,
+        prompts: List[str]
+    ) -> List[Tuple[List[str], List[str], List[str]]]:
+        """Find keywords for ASCII prompts in one automaton scan."""
+        found: List[Set[Tuple[str, str]]] = [set() for _ in prompts]
+        
+        texts = [prompt.lower() for prompt in prompts]
+        starts = list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+        for end, keyword_owners in self._keyword_automaton.iter("\x1e".join(texts)):
+            found[bisect_right(starts, end) - 1].update(keyword_owners)
+            
+        return [
+            (
+                [a for a in self.ACTION_PATTERNS if ("action", a) in matches],
+                [t for t in self.TECH_PATTERNS if ("technology", t) in matches],
+                [f for f in self.FOCUS_PATTERNS if ("focus", f) in matches]
+            )
+            for matches in found
+        ]
 
     def _extract_constraints(self, prompt: str) -> Dict[str, Any]:
         """Extract constraints from the prompt."""
         constraints = {}
         
         # Look for numeric constraints
-        number_patterns = {
-            "max_complexity": r"max(?:imum)?\s+complexity\s+(?:of\s+)?(\d+)",
-            "min_coverage": r"min(?:imum)?\s+coverage\s+(?:of\s+)?(\d+)%?",
-            "timeout": r"timeout\s+(?:of\s+)?(\d+)\s*(?:s|seconds)?",
-        }
-        
-        for key, pattern in number_patterns.items():
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for key, pattern in self._NUMBER_PATTERNS.items():
+            match = pattern.search(prompt)
             if match:
                 constraints[key] = int(match.group(1))
                 
         # Look for boolean constraints
-        bool_patterns = {
-            "strict_mode": r"strict\s+mode",
-            "debug": r"debug\s+mode",
-            "verbose": r"verbose",
-        }
-        
-        for key, pattern in bool_patterns.items():
-            if re.search(pattern, prompt, re.IGNORECASE):
+        for key, pattern in self._BOOL_PATTERNS.items():
+            if pattern.search(prompt):
                 constraints[key] = True
                 
         return constraints
@@ -206,62 +525,62 @@ class PromptProcessor:
         context = {}
         
         # Extract file paths
-        file_matches = re.finditer(r"(?:file|path):\s*([^\s,]+)", prompt)
-        if file_matches:
-            context["files"] = [m.group(1) for m in file_matches]
+        files = [m.group(1) for m in self._FILE_RE.finditer(prompt)]
+        if files:
+            context["files"] = files
             
         # Extract code snippets
-        code_matches = re.finditer(r"```(\w+)?\n(.*?)```", prompt, re.DOTALL)
-        if code_matches:
-            context["code_snippets"] = [
-                {
-                    "language": m.group(1) or "text",
-                    "code": m.group(2).strip()
-                }
-                for m in code_matches
-            ]
+        code_snippets = [
+            {
+                "language": m.group(1) or "text",
+                "code": m.group(2).strip()
+            }
+            for m in self._CODE_RE.finditer(prompt)
+        ]
+        if code_snippets:
+            context["code_snippets"] = code_snippets
             
         # Extract URLs
-        urls = re.finditer(r"https?://\S+", prompt)
+        urls = [m.group(0) for m in self._URL_RE.finditer(prompt)]
         if urls:
-            context["urls"] = [u.group(0) for u in urls]
+            context["urls"] = urls
             
         return context
 
     def _calculate_confidence(
         self,
-        prompt: str,
-        intent: PromptIntent
+        intent: PromptIntent,
+        action_matches: int
     ) -> Dict[str, float]:
-        """Calculate confidence scores for extracted information."""
-        scores = {}
+        """
+        Calculate confidence scores for extracted information.
         
-        # Action confidence
-        action_matches = sum(
-            1 for pattern in self.action_regex.values()
-            if pattern.search(prompt)
-        )
-        scores["action"] = min(1.0, action_matches / len(self.action_regex))
+        Works purely from what extraction already found; the prompt is not
+        scanned again.
         
-        # Technology confidence
-        tech_matches = sum(
-            1 for pattern in self.tech_regex.values()
-            if pattern.search(prompt)
-        )
-        scores["technologies"] = min(1.0, tech_matches / len(self.tech_regex))
+        Args:
+            intent: Extracted intent
+            action_matches: Number of action patterns the prompt matched
+                (the intent only keeps the primary one)
+        """
+        # Action confidence
+        action = min(1.0, action_matches / len(self.ACTION_PATTERNS))
         
-        # Focus areas confidence
-        focus_matches = sum(
-            1 for pattern in self.focus_regex.values()
-            if pattern.search(prompt)
-        )
-        scores["focus_areas"] = min(1.0, focus_matches / len(self.focus_regex))
+        # Technology and focus areas confidence
+        technologies = min(1.0, len(intent.technologies) / len(self.TECH_PATTERNS))
+        focus_areas = min(1.0, len(intent.focus_areas) / len(self.FOCUS_PATTERNS))
         
         # Overall confidence
-        scores["overall"] = (
-            scores["action"] * 0.4 +
-            scores["technologies"] * 0.4 +
-            scores["focus_areas"] * 0.2
-        )
-        
-        return scores
\ No newline at end of file
+        action_weight, tech_weight, focus_weight = self.CONFIDENCE_WEIGHTS
+        return {
+            "action": action,
+            "technologies": technologies,
+            "focus_areas": focus_areas,
+            "overall": (
+                action * action_weight +
+                technologies * tech_weight +
+                focus_areas * focus_weight
+            )
+        }
+
+PromptProcessor._compile_patterns()
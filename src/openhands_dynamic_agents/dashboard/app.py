@@ -2,20 +2,96 @@
 Simple web dashboard for monitoring dynamic agents.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
+import asyncio
 import json
+import os
 from datetime import datetime
 import logging
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 
 from ..analysis.tech_stack import TechStackAnalyzer
 from ..core.dynamic_agent import DynamicAgent
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_HOME_HTML = """
+<html>
+    <head>
+        <title>Dynamic Agents Dashboard</title>
+        <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
+    </head>
+    <body class="bg-gray-100">
+        <div class="container mx-auto px-4 py-8">
+            <h1 class="text-3xl font-bold mb-8">Dynamic Agents Dashboard</h1>
+            
+            <div class="grid grid-cols-1 md:grid-cols-2 gap-6">
+                <!-- Analysis Section -->
+                <div class="bg-white rounded-lg shadow p-6">
+                    <h2 class="text-xl font-semibold mb-4">Technology Analysis</h2>
+                    <form id="analysisForm" class="space-y-4">
+                        <div>
+                            <label class="block text-sm font-medium text-gray-700">Repository Path</label>
+                            <input type="text" id="repoPath" class="mt-1 block w-full rounded-md border-gray-300 shadow-sm">
+                        </div>
+                        <button type="submit" class="bg-blue-500 text-white px-4 py-2 rounded hover:bg-blue-600">
+                            Analyze
+                        </button>
+                    </form>
+                    <div id="analysisResult" class="mt-4"></div>
+                </div>
+                
+                <!-- Agents Section -->
+                <div class="bg-white rounded-lg shadow p-6">
+                    <h2 class="text-xl font-semibold mb-4">Active Agents</h2>
+                    <div id="agentsList" class="space-y-2"></div>
+                </div>
+            </div>
+        </div>
+        
+        <script>
+            // Add dashboard JavaScript here
+            document.getElementById('analysisForm').onsubmit = async (e) => {
+                e.preventDefault();
+                const path = document.getElementById('repoPath').value;
+                const result = await fetch(`/api/analyze?path=${encodeURIComponent(path)}`);
+                const data = await result.json();
+                document.getElementById('analysisResult').innerHTML = 
+                    `<pre class="mt-4 p-4 bg-gray-100 rounded">${JSON.stringify(data, null, 2)}</pre>`;
+            };
+            
+            // Update agents list periodically
+            setInterval(async () => {
+                const result = await fetch('/api/agents');
+                const data = await result.json();
+                document.getElementById('agentsList').innerHTML = 
+                    data.agents.map(agent => 
+                        `<div class="p-2 border rounded">
+                            <div class="font-semibold">${agent.name}</div>
+                            <div class="text-sm text-gray-600">${agent.status}</div>
+                        </div>`
+                    ).join('');
+            }, 5000);
+        </script>
+    </body>
+</html>
+"""
+
+# The home page is static, so one response is built at import time and
+# browsers may cache it
+_HOME_RESPONSE = HTMLResponse(
+    content=_HOME_HTML,
+    headers={"Cache-Control": "public, max-age=3600"}
+)
+
 class Dashboard:
     """Simple web dashboard for dynamic agents."""
     
@@ -31,15 +107,23 @@ class Dashboard:
         self.host = host
         self.port = port
         
-        # Initialize FastAPI app
+        # Parsed agents.json keyed by (mtime_ns, size), reused across polls
+        self._agents_cache: Optional[Tuple[Tuple[int, int], list]] = None
+        
+        # Initialize FastAPI app; orjson encodes the large, float-heavy
+        # analysis and Plotly payloads much faster than the stdlib encoder
         self.app = FastAPI(
             title="Dynamic Agents Dashboard",
-            description="Monitor and manage dynamic agents"
+            description="Monitor and manage dynamic agents",
+            default_response_class=(
+                ORJSONResponse if orjson is not None else JSONResponse
+            )
         )
         self._setup_routes()
         
-        # Initialize analyzers
-        self.tech_analyzer = TechStackAnalyzer()
+        # Initialize analyzers; repeated /api/analyze requests for an
+        # unchanged directory are served from the analyzer's LRU cache
+        self.tech_analyzer = TechStackAnalyzer(cache_size=128)
         
     def _setup_routes(self) -> None:
         """Set up dashboard routes."""
@@ -47,67 +131,7 @@ class Dashboard:
         @self.app.get("/", response_class=HTMLResponse)
         async def home():
             """Render dashboard home page."""
-            return """
-            <html>
-                <head>
-                    <title>Dynamic Agents Dashboard</title>
-                    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-                </head>
-                <body class="bg-gray-100">
-                    <div class="container mx-auto px-4 py-8">
-                        <h1 class="text-3xl font-bold mb-8">Dynamic Agents Dashboard</h1>
-                        
-                        <div class="grid grid-cols-1 md:grid-cols-2 gap-6">
-                            <!-- Analysis Section -->
-                            <div class="bg-white rounded-lg shadow p-6">
-                                <h2 class="text-xl font-semibold mb-4">Technology Analysis</h2>
-                                <form id="analysisForm" class="space-y-4">
-                                    <div>
-                                        <label class="block text-sm font-medium text-gray-700">Repository Path</label>
-                                        <input type="text" id="repoPath" class="mt-1 block w-full rounded-md border-gray-300 shadow-sm">
-                                    </div>
-                                    <button type="submit" class="bg-blue-500 text-white px-4 py-2 rounded hover:bg-blue-600">
-                                        Analyze
-                                    </button>
-                                </form>
-                                <div id="analysisResult" class="mt-4"></div>
-                            </div>
-                            
-                            <!-- Agents Section -->
-                            <div class="bg-white rounded-lg shadow p-6">
-                                <h2 class="text-xl font-semibold mb-4">Active Agents</h2>
-                                <div id="agentsList" class="space-y-2"></div>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <script>
-                        // Add dashboard JavaScript here
-                        document.getElementById('analysisForm').onsubmit = async (e) => {
-                            e.preventDefault();
-                            const path = document.getElementById('repoPath').value;
-                            const result = await fetch(`/api/analyze?path=${encodeURIComponent(path)}`);
-                            const data = await result.json();
-                            document.getElementById('analysisResult').innerHTML = 
-                                `<pre class="mt-4 p-4 bg-gray-100 rounded">${JSON.stringify(data, null, 2)}</pre>`;
-                        };
-                        
-                        // Update agents list periodically
-                        setInterval(async () => {
-                            const result = await fetch('/api/agents');
-                            const data = await result.json();
-                            document.getElementById('agentsList').innerHTML = 
-                                data.agents.map(agent => 
-                                    `<div class="p-2 border rounded">
-                                        <div class="font-semibold">${agent.name}</div>
-                                        <div class="text-sm text-gray-600">${agent.status}</div>
-                                    </div>`
-                                ).join('');
-                        }, 5000);
-                    </script>
-                </body>
-            </html>
-            """
+            return _HOME_RESPONSE
             
         @self.app.get("/api/analyze")
         async def analyze_repo(path: str):
@@ -124,24 +148,52 @@ class Dashboard:
         async def list_agents():
             """List active agents."""
             try:
-                agents = self._load_agents()
+                agents = await self._load_agents()
                 return {"agents": agents}
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
     
-    def _load_agents(self) -> list:
-        """Load active agents information."""
+    async def _load_agents(self) -> list:
+        """
+        Load active agents information.
+        
+        The file is decoded in a worker thread so the event loop is never
+        blocked, and only re-parsed when its mtime or size changes, so
+        dashboard polls are cheap.
+        """
         agents_file = self.data_dir / "agents.json"
-        if not agents_file.exists():
+        try:
+            stat = await asyncio.to_thread(os.stat, agents_file)
+        except FileNotFoundError:
+            self._agents_cache = None
             return []
             
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._agents_cache is not None and self._agents_cache[0] == key:
+            return self._agents_cache[1]
+            
         try:
-            with open(agents_file) as f:
-                return json.load(f)
+            agents = await asyncio.to_thread(self._parse_agents, agents_file)
         except Exception as e:
             logger.error(f"Failed to load agents: {e}")
             return []
             
+        self._agents_cache = (key, agents)
+        return agents
+        
+    @staticmethod
+    def _parse_agents(agents_file: Path) -> list:
+        """
+        Read and decode the agents file.
+        
+        The file is written by another process, so it is read into memory
+        in one go rather than memory-mapped: a writer truncating it in place
+        would otherwise crash the dashboard with SIGBUS mid-parse.
+        """
+        with open(agents_file, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+            
     def start(self) -> None:
         """Start the dashboard server."""
         import uvicorn
@@ -5,14 +5,23 @@ Visualization components for the dashboard.
 from typing import Dict, Any, List, Optional
 import json
 from pathlib import Path
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 class DashboardVisualizer:
     """
     Generate interactive visualizations for analysis results.
+    
+    Plotly is imported inside the create_* methods, so importing this
+    module (or using only the data helpers) does not pay its import cost.
     """
     
+    # Horizontal domains of the three metric gauges (make_subplots'
+    # default spacing for a 1x3 grid)
+    _GAUGE_DOMAINS = (
+        [0.0, 0.2888888888888889],
+        [0.35555555555555557, 0.6444444444444445],
+        [0.7111111111111111, 1.0]
+    )
+    
     def __init__(self, theme: str = "light"):
         """Initialize visualizer with theme."""
         self.theme = theme
@@ -40,6 +49,15 @@ class DashboardVisualizer:
                 "text": "#f3f4f6"
             }
         }[self.theme]
+        
+        # Gauge axis and colour bands are the same for every metric gauge;
+        # Plotly only reads them, so one copy is shared by all of them
+        self._gauge_axis = {"range": [0, 100]}
+        self._gauge_steps = [
+            {"range": [0, 50], "color": self.colors["error"]},
+            {"range": [50, 75], "color": self.colors["warning"]},
+            {"range": [75, 100], "color": self.colors["success"]}
+        ]
 
     def create_tech_stack_visualization(
         self,
@@ -54,6 +72,8 @@ class DashboardVisualizer:
         Returns:
             Dictionary containing Plotly figure data
         """
+        import plotly.graph_objects as go
+        
         # Create sunburst chart for tech stack
         tech_data = self._prepare_tech_data(analysis_result)
         
@@ -95,72 +115,79 @@ class DashboardVisualizer:
         Returns:
             Dictionary containing multiple Plotly figures
         """
-        # Create subplot layout
-        fig = make_subplots(
-            rows=2,
-            cols=2,
-            specs=[
-                [{"type": "domain"}, {"type": "bar"}],
-                [{"type": "scatter"}, {"type": "heatmap"}]
-            ],
-            subplot_titles=(
-                "Technology Distribution",
-                "Framework Usage",
-                "Performance Metrics",
-                "Dependency Matrix"
-            )
-        )
+        import plotly.graph_objects as go
+        
+        # The 2x2 grid is laid out by hand (same domains make_subplots uses
+        # with subplot titles) so the figure is built from one trace list
+        # instead of validating each add_trace call against the grid
+        left, right = [0.0, 0.45], [0.55, 1.0]
+        top, bottom = [0.625, 1.0], [0.0, 0.375]
+        traces = []
         
         # Add technology distribution (pie chart)
         tech_data = results.get("technologies", {})
-        fig.add_trace(
+        traces.append(
             go.Pie(
                 labels=list(tech_data.keys()),
                 values=list(tech_data.values()),
-                name="Technologies"
-            ),
-            row=1, col=1
+                name="Technologies",
+                domain=dict(x=left, y=top)
+            )
         )
         
         # Add framework usage (bar chart)
         framework_data = results.get("frameworks", {})
-        fig.add_trace(
+        traces.append(
             go.Bar(
                 x=list(framework_data.keys()),
                 y=list(framework_data.values()),
-                name="Frameworks"
-            ),
-            row=1, col=2
+                name="Frameworks",
+                xaxis="x",
+                yaxis="y"
+            )
         )
         
         # Add performance metrics (line chart)
         if "performance" in results:
             perf_data = results["performance"]
-            fig.add_trace(
+            traces.append(
                 go.Scatter(
                     x=list(range(len(perf_data))),
                     y=list(perf_data.values()),
                     mode="lines+markers",
-                    name="Performance"
-                ),
-                row=2, col=1
+                    name="Performance",
+                    xaxis="x2",
+                    yaxis="y2"
+                )
             )
             
         # Add dependency matrix (heatmap)
         if "dependencies" in results:
             dep_data = results["dependencies"]
-            fig.add_trace(
+            traces.append(
                 go.Heatmap(
                     z=dep_data["matrix"],
                     x=dep_data["labels"],
                     y=dep_data["labels"],
-                    colorscale="Viridis"
-                ),
-                row=2, col=2
+                    colorscale="Viridis",
+                    xaxis="x3",
+                    yaxis="y3"
+                )
             )
             
-        # Update layout
-        fig.update_layout(
+        layout = dict(
+            xaxis=dict(domain=right, anchor="y"),
+            yaxis=dict(domain=top, anchor="x"),
+            xaxis2=dict(domain=left, anchor="y2"),
+            yaxis2=dict(domain=bottom, anchor="x2"),
+            xaxis3=dict(domain=right, anchor="y3"),
+            yaxis3=dict(domain=bottom, anchor="x3"),
+            annotations=[
+                self._subplot_title("Technology Distribution", left, top),
+                self._subplot_title("Framework Usage", right, top),
+                self._subplot_title("Performance Metrics", left, bottom),
+                self._subplot_title("Dependency Matrix", right, bottom)
+            ],
             height=800,
             showlegend=True,
             paper_bgcolor=self.colors["background"],
@@ -170,7 +197,26 @@ class DashboardVisualizer:
             )
         )
         
-        return fig.to_dict()
+        return go.Figure(data=traces, layout=layout).to_dict()
+
+    @staticmethod
+    def _subplot_title(
+        text: str,
+        x_domain: List[float],
+        y_domain: List[float]
+    ) -> Dict[str, Any]:
+        """Build a title annotation centred above a grid cell."""
+        return dict(
+            text=text,
+            x=(x_domain[0] + x_domain[1]) / 2,
+            y=y_domain[1],
+            xref="paper",
+            yref="paper",
+            xanchor="center",
+            yanchor="bottom",
+            showarrow=False,
+            font=dict(size=16)
+        )
 
     def create_metrics_visualization(
         self,
@@ -185,75 +231,31 @@ class DashboardVisualizer:
         Returns:
             Dictionary containing Plotly figure data
         """
-        # Create gauge charts for key metrics
-        fig = make_subplots(
-            rows=1,
-            cols=3,
-            specs=[[{"type": "indicator"}, {"type": "indicator"}, {"type": "indicator"}]]
-        )
+        import plotly.graph_objects as go
         
-        # Add security score
-        if "security_score" in metrics:
-            fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=metrics["security_score"] * 100,
-                    title={"text": "Security Score"},
-                    gauge={
-                        "axis": {"range": [0, 100]},
-                        "bar": {"color": self.colors["primary"]},
-                        "steps": [
-                            {"range": [0, 50], "color": self.colors["error"]},
-                            {"range": [50, 75], "color": self.colors["warning"]},
-                            {"range": [75, 100], "color": self.colors["success"]}
-                        ]
-                    }
-                ),
-                row=1, col=1
-            )
-            
-        # Add performance score
-        if "performance_score" in metrics:
-            fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=metrics["performance_score"] * 100,
-                    title={"text": "Performance Score"},
-                    gauge={
-                        "axis": {"range": [0, 100]},
-                        "bar": {"color": self.colors["secondary"]},
-                        "steps": [
-                            {"range": [0, 50], "color": self.colors["error"]},
-                            {"range": [50, 75], "color": self.colors["warning"]},
-                            {"range": [75, 100], "color": self.colors["success"]}
-                        ]
-                    }
-                ),
-                row=1, col=2
-            )
-            
-        # Add code quality score
-        if "quality_score" in metrics:
-            fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=metrics["quality_score"] * 100,
-                    title={"text": "Code Quality"},
-                    gauge={
-                        "axis": {"range": [0, 100]},
-                        "bar": {"color": self.colors["success"]},
-                        "steps": [
-                            {"range": [0, 50], "color": self.colors["error"]},
-                            {"range": [50, 75], "color": self.colors["warning"]},
-                            {"range": [75, 100], "color": self.colors["success"]}
-                        ]
-                    }
-                ),
-                row=1, col=3
+        # Create gauge charts for key metrics, one per column of a 1x3 grid
+        gauges = (
+            ("security_score", "Security Score", self.colors["primary"]),
+            ("performance_score", "Performance Score", self.colors["secondary"]),
+            ("quality_score", "Code Quality", self.colors["success"])
+        )
+        traces = [
+            go.Indicator(
+                mode="gauge+number",
+                value=metrics[key] * 100,
+                title={"text": title},
+                domain=dict(x=x_domain, y=[0.0, 1.0]),
+                gauge={
+                    "axis": self._gauge_axis,
+                    "bar": {"color": bar_color},
+                    "steps": self._gauge_steps
+                }
             )
-            
-        # Update layout
-        fig.update_layout(
+            for (key, title, bar_color), x_domain in zip(gauges, self._GAUGE_DOMAINS)
+            if key in metrics
+        ]
+        
+        layout = dict(
             height=400,
             paper_bgcolor=self.colors["background"],
             plot_bgcolor=self.colors["background"],
@@ -262,42 +264,57 @@ class DashboardVisualizer:
             )
         )
         
-        return fig.to_dict()
+        return go.Figure(data=traces, layout=layout).to_dict()
 
     def _prepare_tech_data(
         self,
         analysis_result: Dict[str, Any]
     ) -> Dict[str, List[Any]]:
         """Prepare technology data for visualization."""
-        ids = []
-        labels = []
-        parents = []
-        values = []
-        colors = []
+        technologies = analysis_result["technologies"]
+        frameworks = analysis_result["frameworks"]
+        
+        # Size the parallel lists up front and fill them by index
+        size = 1 + len(technologies) + sum(
+            len(frameworks[tech]) for tech in technologies if tech in frameworks
+        )
+        ids = [None] * size
+        labels = [None] * size
+        parents = [None] * size
+        values = [0.0] * size
+        colors = [None] * size
+        
+        tech_color = self.colors["secondary"]
+        fw_color = self.colors["success"]
         
         # Add root
-        ids.append("root")
-        labels.append("Technologies")
-        parents.append("")
-        values.append(1.0)
-        colors.append(self.colors["primary"])
+        ids[0] = "root"
+        labels[0] = "Technologies"
+        parents[0] = ""
+        values[0] = 1.0
+        colors[0] = self.colors["primary"]
+        i = 1
         
-        # Add technologies
-        for tech, score in analysis_result["technologies"].items():
-            ids.append(f"tech_{tech}")
-            labels.append(tech)
-            parents.append("root")
-            values.append(score)
-            colors.append(self.colors["secondary"])
+        # Add technologies; each id is built once and reused as the parent
+        # of its frameworks (ids only need to be unique within the figure)
+        for tech, score in technologies.items():
+            tech_id = "tech/" + tech
+            ids[i] = tech_id
+            labels[i] = tech
+            parents[i] = "root"
+            values[i] = score
+            colors[i] = tech_color
+            i += 1
             
             # Add frameworks for each technology
-            if tech in analysis_result["frameworks"]:
-                for fw, fw_score in analysis_result["frameworks"][tech].items():
-                    ids.append(f"fw_{tech}_{fw}")
-                    labels.append(fw)
-                    parents.append(f"tech_{tech}")
-                    values.append(fw_score * score)  # Adjust score relative to parent
-                    colors.append(self.colors["success"])
+            if tech in frameworks:
+                for fw, fw_score in frameworks[tech].items():
+                    ids[i] = tech_id + "/" + fw
+                    labels[i] = fw
+                    parents[i] = tech_id
+                    values[i] = fw_score * score  # Adjust score relative to parent
+                    colors[i] = fw_color
+                    i += 1
                     
         return {
             "ids": ids,
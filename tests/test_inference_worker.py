@@ -0,0 +1,149 @@
+"""
+Tests for the InferenceWorker request coalescer.
+"""
+
+from typing import List
+import asyncio
+
+import pytest
+
+from openhands_dynamic_agents.core.inference_worker import InferenceWorker
+
+
+class RecordingHandler:
+    """Batch handler that records every batch it receives."""
+
+    def __init__(self, fail: bool = False, block: bool = False):
+        self.batches: List[List[str]] = []
+        self.fail = fail
+        self.block = block
+
+    async def __call__(self, items: List[str]) -> List[str]:
+        self.batches.append(list(items))
+        if self.block:
+            await asyncio.Event().wait()
+        if self.fail:
+            raise RuntimeError("backend down")
+        return [item.upper() for item in items]
+
+
+def test_full_batch_is_one_handler_call():
+    async def scenario():
+        handler = RecordingHandler()
+        worker = InferenceWorker(handler, max_batch_size=3, max_wait_ms=10_000)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(worker.run(p) for p in ["a", "b", "c"])), 2
+        )
+        await worker.close()
+        return handler, results
+
+    handler, results = asyncio.run(scenario())
+    assert results == ["A", "B", "C"]
+    assert handler.batches == [["a", "b", "c"]]
+
+
+def test_partial_batch_is_flushed_after_max_wait():
+    async def scenario():
+        handler = RecordingHandler()
+        worker = InferenceWorker(handler, max_batch_size=8, max_wait_ms=20)
+        results = await asyncio.wait_for(
+            asyncio.gather(worker.run("a"), worker.run("b")), 2
+        )
+        await worker.close()
+        return handler, results
+
+    handler, results = asyncio.run(scenario())
+    assert results == ["A", "B"]
+    assert handler.batches == [["a", "b"]]
+
+
+def test_items_are_bucketed_by_size():
+    async def scenario():
+        handler = RecordingHandler()
+        worker = InferenceWorker(handler, max_batch_size=2, max_wait_ms=20, size_fn=len)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(worker.run(p) for p in ["a", "bbbbbbbb", "c", "dddddddd"])), 2
+        )
+        await worker.close()
+        return handler, results
+
+    handler, results = asyncio.run(scenario())
+    assert results == ["A", "BBBBBBBB", "C", "DDDDDDDD"]
+    assert sorted(handler.batches) == [["a", "c"], ["bbbbbbbb", "dddddddd"]]
+
+
+def test_handler_failure_reaches_every_caller_and_worker_recovers():
+    async def scenario():
+        handler = RecordingHandler(fail=True)
+        worker = InferenceWorker(handler, max_batch_size=2, max_wait_ms=20)
+        failed = await asyncio.wait_for(
+            asyncio.gather(worker.run("a"), worker.run("b"), return_exceptions=True), 2
+        )
+        handler.fail = False
+        recovered = await asyncio.wait_for(worker.run("c"), 2)
+        await worker.close()
+        return failed, recovered
+
+    failed, recovered = asyncio.run(scenario())
+    assert all(isinstance(e, RuntimeError) for e in failed)
+    assert recovered == "C"
+
+
+def test_size_fn_error_only_fails_its_caller():
+    async def scenario():
+        worker = InferenceWorker(RecordingHandler(), max_wait_ms=20, size_fn=len)
+        results = await asyncio.wait_for(
+            asyncio.gather(worker.run("ok"), worker.run(object()), return_exceptions=True), 2
+        )
+        await worker.close()
+        return results
+
+    ok, error = asyncio.run(scenario())
+    assert ok == "OK"
+    assert isinstance(error, TypeError)
+
+
+@pytest.mark.parametrize("block", [False, True])
+def test_close_cancels_waiting_callers(block):
+    async def scenario():
+        worker = InferenceWorker(
+            RecordingHandler(block=block), max_batch_size=2, max_wait_ms=10_000
+        )
+        # With block=True the pair is in flight in the handler; otherwise the
+        # single item is still waiting in its bucket
+        items = ["a", "b"] if block else ["a"]
+        calls = [asyncio.ensure_future(worker.run(p)) for p in items]
+        await asyncio.sleep(0.05)
+        await worker.close()
+        return await asyncio.wait_for(
+            asyncio.gather(*calls, return_exceptions=True), 2
+        )
+
+    results = asyncio.run(scenario())
+    assert results
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+
+def test_batches_from_different_buckets_run_concurrently():
+    async def scenario():
+        running = 0
+        overlapped = False
+
+        async def handler(items):
+            nonlocal running, overlapped
+            running += 1
+            overlapped = overlapped or running > 1
+            await asyncio.sleep(0.05)
+            running -= 1
+            return [item.upper() for item in items]
+
+        worker = InferenceWorker(handler, max_batch_size=1, max_wait_ms=10_000, size_fn=len)
+        results = await asyncio.wait_for(
+            asyncio.gather(worker.run("a"), worker.run("bbbbbbbb")), 2
+        )
+        await worker.close()
+        return overlapped, results
+
+    overlapped, results = asyncio.run(scenario())
+    assert results == ["A", "BBBBBBBB"]
+    assert overlapped
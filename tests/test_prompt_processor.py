@@ -0,0 +1,86 @@
+"""
+Tests for PromptProcessor keyword matching.
+"""
+
+import pytest
+
+from openhands_dynamic_agents.core.prompt_processor import PromptProcessor
+
+
+class RegexProcessor(PromptProcessor):
+    """Processor forced onto the per-pattern regex path."""
+
+
+RegexProcessor._keyword_automaton = None
+
+
+@pytest.fixture(params=["automaton", "regex"])
+def processor(request):
+    if request.param == "regex":
+        return RegexProcessor()
+    if PromptProcessor._keyword_automaton is None:
+        pytest.skip("pyahocorasick is not installed")
+    return PromptProcessor()
+
+
+def test_subclass_patterns_with_lookarounds_compile():
+    class CppProcessor(PromptProcessor):
+        TECH_PATTERNS = {
+            **PromptProcessor.TECH_PATTERNS,
+            "cpp": r"c\+\+(?!/cli)",
+        }
+
+    processor = CppProcessor()
+    result = processor.process("review this c++ code")
+    assert result.success
+    assert result.data.technologies == ["cpp"]
+    assert not processor.process("review this c++/cli code").success
+
+
+def test_unicode_case_folding_matches_ignorecase(processor):
+    # re.IGNORECASE folds the long s to "s"; both paths must agree with it
+    result = processor.process("review python \u017fecurity")
+    assert result.success
+    assert result.data.focus_areas == ["security"]
+    assert processor.process_batch(["review python \u017fecurity"])[0].data.focus_areas == [
+        "security"
+    ]
+
+
+def test_non_ascii_prompts_fold_case_like_re(processor):
+    # re.IGNORECASE matches the dotless i against "i"; re2 does not
+    result = processor.process("review javascrıpt")
+    assert result.success
+    assert result.data.technologies == ["javascript"]
+
+
+def test_overlapping_keywords_are_all_credited(processor):
+    # "ts" (typescript) and "sql" (database) overlap inside "tsql"
+    result = processor.process("analyze tsql")
+    assert result.success
+    assert result.data.technologies == ["typescript", "database"]
+    assert processor.process_batch(["analyze tsql"])[0].data.technologies == [
+        "typescript", "database"
+    ]
+
+
+def test_batches_reuse_cached_prompts(processor, monkeypatch):
+    processor.process("review python security")
+    scanned = []
+    scan_many = processor._scan_keywords_many
+
+    def recording_scan(prompts):
+        scanned.append(list(prompts))
+        return scan_many(prompts)
+
+    monkeypatch.setattr(processor, "_scan_keywords_many", recording_scan)
+    results = processor.process_batch(
+        ["review python security", "analyze tsql", "analyze tsql"]
+    )
+    assert scanned == [["analyze tsql"]]
+    assert [r.data.technologies for r in results] == [
+        ["python"], ["typescript", "database"], ["typescript", "database"]
+    ]
+
+    processor.process_batch(["analyze tsql"])
+    assert scanned == [["analyze tsql"]]
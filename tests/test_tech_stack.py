@@ -0,0 +1,88 @@
+"""
+Tests for TechStackAnalyzer result caching.
+"""
+
+import os
+
+from openhands_dynamic_agents.analysis.tech_stack import TechStackAnalyzer
+
+
+def make_repo(tmp_path):
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "app.py").write_text("from flask import Flask\n")
+    return tmp_path
+
+
+def test_failures_are_not_cached(tmp_path, monkeypatch):
+    repo = make_repo(tmp_path)
+    analyzer = TechStackAnalyzer()
+    detect = analyzer._detect_technologies
+
+    def fail_once(files):
+        monkeypatch.setattr(analyzer, "_detect_technologies", detect)
+        raise MemoryError("transient")
+
+    monkeypatch.setattr(analyzer, "_detect_technologies", fail_once)
+    assert not analyzer.analyze_directory(repo).success
+
+    result = analyzer.analyze_directory(repo)
+    assert result.success
+    assert result.data["frameworks"] == {"python": {"flask": 1.0}}
+
+
+def test_nested_file_change_invalidates_cache(tmp_path):
+    repo = make_repo(tmp_path)
+    analyzer = TechStackAnalyzer()
+    first = analyzer.analyze_directory(repo)
+    assert analyzer.analyze_directory(repo).data == first.data
+    assert analyzer._analyze_cached.cache_info().hits == 1
+
+    nested = repo / "pkg" / "app.py"
+    nested.write_text("import django\n")
+    stat = nested.stat()
+    os.utime(nested, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = analyzer.analyze_directory(repo)
+    assert second.data != first.data
+    assert second.data["frameworks"] == {"python": {"django": 1.0}}
+    assert analyzer._analyze_cached.cache_info().misses == 2
+
+
+def test_cached_results_are_not_shared(tmp_path):
+    repo = make_repo(tmp_path)
+    analyzer = TechStackAnalyzer()
+    analyzer.analyze_directory(repo).data["frameworks"]["python"]["flask"] = 0.0
+
+    result = analyzer.analyze_directory(repo)
+    assert result.data["frameworks"] == {"python": {"flask": 1.0}}
+    assert analyzer._analyze_cached.cache_info().hits == 1
+
+
+def test_tech_names_need_not_be_identifiers(tmp_path):
+    class CppAnalyzer(TechStackAnalyzer):
+        TECH_PATTERNS = {
+            **TechStackAnalyzer.TECH_PATTERNS,
+            "c++": {"files": [r"\.cpp$"], "frameworks": {"qt": ["QObject"]}},
+        }
+
+    (tmp_path / "main.cpp").write_text("class W : public QObject {};\n")
+    result = CppAnalyzer().analyze_directory(tmp_path)
+    assert result.success
+    assert result.data["frameworks"] == {"c++": {"qt": 1.0}}
+
+
+def test_empty_framework_patterns_score_nothing(tmp_path):
+    class StubAnalyzer(TechStackAnalyzer):
+        TECH_PATTERNS = {
+            "python": {
+                "files": [r"\.py$"],
+                "frameworks": {"flask": ["flask"], "stub": [], "blank": [""]},
+            }
+        }
+
+    make_repo(tmp_path)
+    analyzer = StubAnalyzer()
+    analyzer._fw_automata = {}  # force the regex fallback
+    result = analyzer.analyze_directory(tmp_path)
+    assert result.data["frameworks"] == {"python": {"flask": 1.0}}